@@ -9,24 +9,63 @@ future reviews based on recall quality.
 Usage:
     python srs_db.py init                          # Create DB in .ai-learn/srs.db
     python srs_db.py add-card --question Q --answer A [--context path] [--tags t1,t2] [--session-id N]
+    python srs_db.py add-cards < cards.json        # Add many cards (JSON array or NDJSON on stdin)
     python srs_db.py add-session --topic T --summary S --gaps N --cards N
-    python srs_db.py due                           # List cards due for review
+    python srs_db.py due [--limit N] [--after-review TS --after-id ID]  # List cards due for review
     python srs_db.py review --card-id ID --quality Q  # Record review (quality 0-5)
+    python srs_db.py review-many < reviews.json    # Record many reviews (JSON array or NDJSON on stdin)
     python srs_db.py stats                         # Show learning statistics
     python srs_db.py cards [--topic T] [--session-id N]  # List cards with filters
     python srs_db.py sessions                      # List all teach-back sessions
     python srs_db.py export [--format md|csv]      # Export cards
+    python srs_db.py batch < commands.txt          # Run one command per line in a single process
+    python srs_db.py vacuum                        # Compact DB, refresh planner stats, truncate WAL
 """
 
 import argparse
+import atexit
+import csv
+import functools
+import io
 import json
+import shlex
 import sqlite3
 import sys
+import threading
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 DB_DIR = ".ai-learn"
 DB_NAME = "srs.db"
+DIFFICULTIES = ("easy", "medium", "hard")
+# Ids bound per IN (...) list; stays under SQLite's historical 999-variable limit
+IN_CHUNK_SIZE = 500
+
+# Open connections keyed by database path, reused across calls so batch
+# drivers importing this module keep SQLite's page cache warm.
+_connections: dict[str, sqlite3.Connection] = {}
+# Connections are shared across threads (check_same_thread=False), so every
+# use of one happens under that connection's own lock: a reader on the
+# read-only connection never waits for a write transaction. _cache_lock only
+# guards the two dicts.
+_conn_locks: dict[sqlite3.Connection, threading.RLock] = {}
+_cache_lock = threading.Lock()
+_prefetch_executor: ThreadPoolExecutor | None = None
+
+# Clustered by card: review history is always read per card, and each card
+# numbers its own reviews 1, 2, 3...
+REVIEWS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS reviews (
+    card_id INTEGER NOT NULL REFERENCES cards(id),
+    id INTEGER NOT NULL,
+    quality INTEGER NOT NULL CHECK(quality BETWEEN 0 AND 5),
+    reviewed_at TEXT NOT NULL DEFAULT (datetime('now')),
+    PRIMARY KEY (card_id, id)
+) WITHOUT ROWID;
+"""
 
 SCHEMA = """
 CREATE TABLE IF NOT EXISTS sessions (
@@ -55,23 +94,70 @@ CREATE TABLE IF NOT EXISTS cards (
     deleted_at TEXT
 );
 
-CREATE TABLE IF NOT EXISTS reviews (
-    id INTEGER PRIMARY KEY AUTOINCREMENT,
-    card_id INTEGER NOT NULL REFERENCES cards(id),
-    quality INTEGER NOT NULL CHECK(quality BETWEEN 0 AND 5),
-    reviewed_at TEXT NOT NULL DEFAULT (datetime('now'))
-);
-
-CREATE INDEX IF NOT EXISTS idx_cards_next_review ON cards(next_review)
+""" + REVIEWS_SCHEMA + """
+-- Keyset order for paging through the due queue. The trailing columns make it
+-- covering for get_stats, which then never reads the wide card rows
+-- (deleted_at is always NULL here, but SQLite before 3.46 only treats the
+-- index as covering if it lists every column the query names).
+CREATE INDEX IF NOT EXISTS idx_cards_schedule
+    ON cards(next_review, id, repetitions, ease_factor, deleted_at)
     WHERE deleted_at IS NULL;
+-- Superseded by idx_cards_schedule; dropped so reviews stop maintaining them
+DROP INDEX IF EXISTS idx_cards_due;
+DROP INDEX IF EXISTS idx_cards_next_review;
+DROP INDEX IF EXISTS idx_cards_ef;
+DROP INDEX IF EXISTS idx_cards_reps_ef;
 CREATE INDEX IF NOT EXISTS idx_cards_session ON cards(session_id);
-CREATE INDEX IF NOT EXISTS idx_reviews_card ON reviews(card_id);
 """
 
+# Full-text index over the searchable card fields, kept in sync by triggers.
+# Created separately from SCHEMA because some SQLite builds lack FTS5.
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS cards_fts USING fts5(
+    question, context, tags, content='cards', content_rowid='id'
+);
 
-def _now() -> str:
-    """Current UTC time as ISO string (consistent with SQLite datetime('now'))."""
-    return datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+CREATE TRIGGER IF NOT EXISTS cards_ai AFTER INSERT ON cards BEGIN
+    INSERT INTO cards_fts (rowid, question, context, tags)
+    VALUES (new.id, new.question, new.context, new.tags);
+END;
+CREATE TRIGGER IF NOT EXISTS cards_ad AFTER DELETE ON cards BEGIN
+    INSERT INTO cards_fts (cards_fts, rowid, question, context, tags)
+    VALUES ('delete', old.id, old.question, old.context, old.tags);
+END;
+CREATE TRIGGER IF NOT EXISTS cards_au AFTER UPDATE OF question, context, tags ON cards BEGIN
+    INSERT INTO cards_fts (cards_fts, rowid, question, context, tags)
+    VALUES ('delete', old.id, old.question, old.context, old.tags);
+    INSERT INTO cards_fts (rowid, question, context, tags)
+    VALUES (new.id, new.question, new.context, new.tags);
+END;
+"""
+
+# Hot-path statements are module constants so every call hands sqlite3 the
+# same SQL text and hits its per-connection prepared statement cache.
+SQL_INSERT_SESSION = """INSERT INTO sessions (topic, summary, gaps_found, cards_generated)
+    VALUES (?, ?, ?, ?)"""
+SQL_INSERT_CARD = """INSERT INTO cards (question, answer, context, tags, difficulty, session_id)
+    VALUES (?, ?, ?, ?, ?, ?)"""
+SQL_UPDATE_SCHED = """UPDATE cards
+    SET repetitions = ?, ease_factor = ?, interval_days = ?,
+        next_review = datetime('now', ? || ' days')
+    WHERE id = ?"""
+SQL_LIST_CARDS = """SELECT id, question, answer, context, tags, difficulty,
+           ease_factor, interval_days, repetitions, next_review
+    FROM cards WHERE deleted_at IS NULL
+    ORDER BY created_at DESC"""
+# Review ids count per card (WITHOUT ROWID has no AUTOINCREMENT). MAX(id)
+# within one card is a primary-key seek, and callers hold the write lock,
+# so MAX(id) + 1 is race-free.
+SQL_INSERT_REVIEW = """INSERT INTO reviews (card_id, id, quality)
+    SELECT :card_id, COALESCE(MAX(id), 0) + 1, :quality
+    FROM reviews WHERE card_id = :card_id"""
+
+
+def _now(days: int = 0) -> str:
+    """Current UTC time (shifted by days) as ISO string, matching SQLite datetime('now')."""
+    return (datetime.now(timezone.utc) + timedelta(days=days)).strftime("%Y-%m-%d %H:%M:%S")
 
 
 def get_db_path() -> Path:
@@ -79,19 +165,155 @@ def get_db_path() -> Path:
     return Path.cwd() / DB_DIR / DB_NAME
 
 
-def connect(db_path: Path | None = None) -> sqlite3.Connection:
-    """Connect to the SRS database."""
-    path = db_path or get_db_path()
+def _configure(conn: sqlite3.Connection, readonly: bool = False) -> None:
+    """Apply per-connection PRAGMAs (WAL + relaxed fsync, in-memory temp, 20 MB cache)."""
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-20000")
+    if readonly:
+        # Journal mode is persistent in the file; the rest only affects writers
+        return
+    conn.execute("PRAGMA journal_mode=WAL")
+    # NORMAL is durable across process crashes in WAL mode; only an OS crash
+    # can roll back the most recent commit.
+    conn.execute("PRAGMA synchronous=NORMAL")
+    # Checkpoint every ~1000 pages and cap the WAL file left behind at 64 MB
+    conn.execute("PRAGMA wal_autocheckpoint=1000")
+    conn.execute("PRAGMA journal_size_limit=67108864")
+    conn.execute("PRAGMA foreign_keys=ON")
+
+
+def _migrate_reviews(conn: sqlite3.Connection) -> None:
+    """Rebuild a reviews table from before the WITHOUT ROWID layout, keeping its ids."""
+
+    def is_legacy() -> bool:
+        row = conn.execute(
+            "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'reviews'"
+        ).fetchone()
+        return row is not None and "WITHOUT ROWID" not in row[0].upper()
+
+    if not is_legacy():
+        return
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        # Another process may have migrated while we waited for the lock
+        if is_legacy():
+            conn.execute("ALTER TABLE reviews RENAME TO reviews_legacy")
+            conn.execute(REVIEWS_SCHEMA)
+            # Old ids are globally unique, hence also unique per card
+            conn.execute(
+                """INSERT INTO reviews (card_id, id, quality, reviewed_at)
+                   SELECT card_id, id, quality, reviewed_at FROM reviews_legacy"""
+            )
+            conn.execute("DROP TABLE reviews_legacy")
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
+
+
+def _connection_key(path: Path, readonly: bool) -> str:
+    """Return the sqlite3.connect() target for path: a mode=ro URI for readers."""
+    return f"{path.resolve().as_uri()}?mode=ro" if readonly else str(path)
+
+
+def _new_connection(path: Path, readonly: bool) -> sqlite3.Connection:
+    """Open and configure a new, uncached connection to the database at path."""
     if not path.exists():
         print(f"Database not found at {path}. Run 'init' first.", file=sys.stderr)
         sys.exit(1)
-    conn = sqlite3.connect(str(path))
+    # Autocommit mode: writers open their own transactions via _transaction()
+    conn = sqlite3.connect(
+        _connection_key(path, readonly),
+        uri=readonly,
+        cached_statements=256,
+        isolation_level=None,
+        check_same_thread=False,
+    )
     conn.row_factory = sqlite3.Row
-    conn.execute("PRAGMA journal_mode=WAL")
-    conn.execute("PRAGMA foreign_keys=ON")
+    _configure(conn, readonly)
+    if not readonly:
+        _migrate_reviews(conn)
     return conn
 
 
+def _open(path: Path, readonly: bool) -> sqlite3.Connection:
+    """Return the cached read-write or read-only connection for path."""
+    key = _connection_key(path, readonly)
+    with _cache_lock:
+        conn = _connections.get(key)
+        if conn is not None:
+            return conn
+        conn = _new_connection(path, readonly)
+        _connections[key] = conn
+        _conn_locks[conn] = threading.RLock()
+        return conn
+
+
+def _lock(conn: sqlite3.Connection) -> threading.RLock:
+    """Return the lock serializing use of a cached connection."""
+    with _cache_lock:
+        return _conn_locks[conn]
+
+
+def connect(db_path: Path | None = None) -> sqlite3.Connection:
+    """Return the (cached) read-write connection to the SRS database."""
+    return _open(db_path or get_db_path(), readonly=False)
+
+
+def connect_ro(db_path: Path | None = None) -> sqlite3.Connection:
+    """
+    Return the (cached) read-only connection used by stats and listings.
+
+    In WAL mode this reader never blocks, or is blocked by, the writer.
+    """
+    return _open(db_path or get_db_path(), readonly=True)
+
+
+@atexit.register
+def close_connections() -> None:
+    """
+    Close every cached connection.
+
+    Read-write connections run PRAGMA optimize first, which refreshes
+    planner statistics for tables that have changed enough to need it
+    (on SQLite 3.46+, 0x10000 checks every table, not just the ones this
+    connection queried). init and vacuum analyze every table.
+    """
+    with _cache_lock:
+        conns = [
+            (key, conn, _conn_locks.pop(conn)) for key, conn in _connections.items()
+        ]
+        _connections.clear()
+    for key, conn, lock in conns:
+        with lock:
+            if not key.endswith("?mode=ro"):
+                try:
+                    conn.execute("PRAGMA analysis_limit=400")
+                    conn.execute("PRAGMA optimize=0x10002")
+                except sqlite3.Error:
+                    pass
+            conn.close()
+
+
+@contextmanager
+def _transaction(conn: sqlite3.Connection) -> Iterator[sqlite3.Connection]:
+    """
+    Run the enclosed statements in one explicit write transaction.
+
+    BEGIN IMMEDIATE takes the write lock up front, so a read-then-write
+    sequence cannot fail with SQLITE_BUSY on lock upgrade. Holds the
+    connection's lock for the duration.
+    """
+    with _lock(conn):
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+
 def init_db() -> Path:
     """Create database directory and schema."""
     db_path = get_db_path()
@@ -103,12 +325,36 @@ def init_db() -> Path:
         gitignore.write_text("*\n!.gitignore\n")
 
     conn = sqlite3.connect(str(db_path))
+    _configure(conn)
     conn.executescript(SCHEMA)
+    _migrate_reviews(conn)
+    try:
+        conn.executescript(FTS_SCHEMA)
+        # Index cards that predate the FTS table
+        conn.execute("INSERT INTO cards_fts (cards_fts) VALUES ('rebuild')")
+        conn.commit()
+    except sqlite3.OperationalError:
+        print("FTS5 unavailable; topic search will scan cards.", file=sys.stderr)
+    # Re-running init on an existing database is the upgrade path, so give the
+    # planner statistics for the indexes now; analysis_limit keeps it quick
+    conn.execute("PRAGMA analysis_limit=400")
+    conn.execute("ANALYZE")
     conn.close()
     print(f"Initialized SRS database at {db_path}")
     return db_path
 
 
+def vacuum_db() -> None:
+    """Rebuild the database file, refresh planner statistics and truncate the WAL."""
+    conn = connect()
+    with _lock(conn):
+        conn.execute("VACUUM")
+        conn.execute("ANALYZE")
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    print(f"Vacuumed SRS database at {get_db_path()}")
+
+
+@functools.lru_cache(maxsize=4096)
 def sm2_update(
     quality: int,
     repetitions: int,
@@ -127,6 +373,9 @@ def sm2_update(
         5 - Perfect, instant recall
 
     Returns (new_repetitions, new_ease_factor, new_interval_days).
+
+    Pure and memoized: ease factors follow a handful of deterministic paths
+    from 2.5, so the same inputs recur across cards.
     """
     new_ef = ease_factor + (0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02))
     new_ef = max(1.3, new_ef)
@@ -149,17 +398,46 @@ def sm2_update(
 def add_session(topic: str, summary: str = "", gaps: int = 0, cards: int = 0) -> int:
     """Record a teach-back session. Returns session ID."""
     conn = connect()
-    cur = conn.execute(
-        "INSERT INTO sessions (topic, summary, gaps_found, cards_generated) VALUES (?, ?, ?, ?)",
-        (topic, summary, gaps, cards),
-    )
-    conn.commit()
+    with _transaction(conn):
+        cur = conn.execute(SQL_INSERT_SESSION, (topic, summary, gaps, cards))
     session_id = cur.lastrowid
-    conn.close()
     print(f"Session #{session_id} recorded: {topic}")
     return session_id
 
 
+def add_cards_bulk(cards: list[dict]) -> list[int]:
+    """
+    Add many flashcards in a single transaction. Returns card IDs.
+
+    Each card is a dict with required "question" and "answer" keys and
+    optional "context", "tags", "difficulty" and "session_id" keys.
+    """
+    rows = [
+        (
+            c["question"],
+            c["answer"],
+            c.get("context", ""),
+            c.get("tags", ""),
+            c.get("difficulty", "medium"),
+            c.get("session_id"),
+        )
+        for c in cards
+    ]
+    if not rows:
+        return []
+
+    conn = connect()
+    with _transaction(conn):
+        conn.executemany(SQL_INSERT_CARD, rows)
+        # AUTOINCREMENT ids are contiguous within one write transaction
+        last_id = conn.execute("SELECT last_insert_rowid()").fetchone()[0]
+
+    card_ids = list(range(last_id - len(rows) + 1, last_id + 1))
+    for card_id, row in zip(card_ids, rows):
+        print(f"Card #{card_id} added: {row[0][:60]}...")
+    return card_ids
+
+
 def add_card(
     question: str,
     answer: str,
@@ -169,63 +447,129 @@ def add_card(
     session_id: int | None = None,
 ) -> int:
     """Add a flashcard. Returns card ID."""
-    conn = connect()
-    cur = conn.execute(
-        """INSERT INTO cards (question, answer, context, tags, difficulty, session_id)
-           VALUES (?, ?, ?, ?, ?, ?)""",
-        (question, answer, context, tags, difficulty, session_id),
-    )
-    conn.commit()
-    card_id = cur.lastrowid
-    conn.close()
-    print(f"Card #{card_id} added: {question[:60]}...")
-    return card_id
+    return add_cards_bulk([{
+        "question": question,
+        "answer": answer,
+        "context": context,
+        "tags": tags,
+        "difficulty": difficulty,
+        "session_id": session_id,
+    }])[0]
+
+
+def _read_json_records(text: str) -> list:
+    """Parse a JSON array or newline-delimited JSON objects."""
+    text = text.strip()
+    if not text:
+        return []
+    if text.startswith("["):
+        return json.loads(text)
+    return [json.loads(line) for line in text.splitlines() if line.strip()]
+
+
+def read_cards_input(text: str) -> list[dict]:
+    """Parse cards from a JSON array or newline-delimited JSON objects."""
+    cards = _read_json_records(text)
+    for i, c in enumerate(cards):
+        if (
+            not isinstance(c, dict)
+            or not isinstance(c.get("question"), str)
+            or not isinstance(c.get("answer"), str)
+            or not c["question"]
+            or not c["answer"]
+        ):
+            raise ValueError(f"card {i}: non-empty string 'question' and 'answer' are required")
+        for key in ("context", "tags"):
+            if not isinstance(c.get(key), (str, type(None))):
+                raise ValueError(f"card {i}: '{key}' must be a string")
+        # type() rather than isinstance(): JSON true must not pass as an int
+        if c.get("session_id") is not None and type(c["session_id"]) is not int:
+            raise ValueError(f"card {i}: 'session_id' must be an integer")
+        if c.get("difficulty", "medium") not in DIFFICULTIES:
+            raise ValueError(f"card {i}: 'difficulty' must be one of {', '.join(DIFFICULTIES)}")
+    return cards
+
+
+def get_due_cards(
+    limit: int = 20,
+    after_next_review: str | None = None,
+    after_id: int | None = None,
+) -> list[sqlite3.Row]:
+    """
+    Get cards due for review (next_review <= now), ordered by (next_review, id).
 
+    Pass the next_review and id of the last card of a page as
+    after_next_review / after_id to fetch the following page.
+    """
+    if (after_next_review is None) != (after_id is None):
+        raise ValueError("after_next_review and after_id must be given together")
+    conn = connect_ro()
+    with _lock(conn):
+        # A bound constant lets the planner range-seek the next_review index
+        now = _now()
+        if after_id is not None:
+            rows = conn.execute(
+                """SELECT id, question, answer, context, tags, difficulty,
+                          ease_factor, interval_days, repetitions, next_review
+                   FROM cards
+                   WHERE deleted_at IS NULL AND next_review <= ?
+                     AND (next_review, id) > (?, ?)
+                   ORDER BY next_review, id
+                   LIMIT ?""",
+                (now, after_next_review, after_id, limit),
+            ).fetchall()
+        else:
+            rows = conn.execute(
+                """SELECT id, question, answer, context, tags, difficulty,
+                          ease_factor, interval_days, repetitions, next_review
+                   FROM cards
+                   WHERE deleted_at IS NULL AND next_review <= ?
+                   ORDER BY next_review, id
+                   LIMIT ?""",
+                (now, limit),
+            ).fetchall()
+    return rows
+
+
+def prefetch_next_due(
+    after_next_review: str | None = None, after_id: int | None = None
+) -> Future:
+    """
+    Fetch the next due card on a background thread.
 
-def get_due_cards(limit: int = 20) -> list[dict]:
-    """Get cards due for review (next_review <= now)."""
-    conn = connect()
-    rows = conn.execute(
-        """SELECT id, question, answer, context, tags, difficulty,
-                  ease_factor, interval_days, repetitions, next_review
-           FROM cards
-           WHERE deleted_at IS NULL AND next_review <= datetime('now')
-           ORDER BY next_review ASC
-           LIMIT ?""",
-        (limit,),
-    ).fetchall()
-    conn.close()
-    return [dict(r) for r in rows]
+    Pass the card under review as after_next_review / after_id so it is
+    skipped. The returned future resolves to get_due_cards(limit=1).
+    """
+    global _prefetch_executor
+    with _cache_lock:
+        if _prefetch_executor is None:
+            _prefetch_executor = ThreadPoolExecutor(max_workers=1)
+    return _prefetch_executor.submit(get_due_cards, 1, after_next_review, after_id)
 
 
 def record_review(card_id: int, quality: int) -> dict:
     """Record a review and update SM-2 scheduling. Returns updated card info."""
     conn = connect()
-    card = conn.execute(
-        "SELECT * FROM cards WHERE id = ? AND deleted_at IS NULL", (card_id,)
-    ).fetchone()
-    if not card:
-        print(f"Card #{card_id} not found.", file=sys.stderr)
-        conn.close()
-        sys.exit(1)
-
-    new_reps, new_ef, new_interval = sm2_update(
-        quality, card["repetitions"], card["ease_factor"], card["interval_days"]
-    )
-    next_dt = datetime.now(timezone.utc) + timedelta(days=new_interval)
-    next_review = next_dt.strftime("%Y-%m-%d %H:%M:%S")
-
-    conn.execute(
-        """UPDATE cards
-           SET repetitions = ?, ease_factor = ?, interval_days = ?, next_review = ?
-           WHERE id = ?""",
-        (new_reps, new_ef, new_interval, next_review, card_id),
-    )
-    conn.execute(
-        "INSERT INTO reviews (card_id, quality) VALUES (?, ?)", (card_id, quality)
-    )
-    conn.commit()
-    conn.close()
+    with _transaction(conn):
+        card = conn.execute(
+            """SELECT repetitions, ease_factor, interval_days
+               FROM cards WHERE id = ? AND deleted_at IS NULL""",
+            (card_id,),
+        ).fetchone()
+        if not card:
+            print(f"Card #{card_id} not found.", file=sys.stderr)
+            sys.exit(1)
+
+        new_reps, new_ef, new_interval = sm2_update(
+            quality, card["repetitions"], card["ease_factor"], card["interval_days"]
+        )
+        conn.execute(
+            SQL_UPDATE_SCHED, (new_reps, new_ef, new_interval, new_interval, card_id)
+        )
+        conn.execute(SQL_INSERT_REVIEW, {"card_id": card_id, "quality": quality})
+        next_review = conn.execute(
+            "SELECT next_review FROM cards WHERE id = ?", (card_id,)
+        ).fetchone()[0]
 
     return {
         "card_id": card_id,
@@ -237,142 +581,265 @@ def record_review(card_id: int, quality: int) -> dict:
     }
 
 
-def get_stats() -> dict:
-    """Get learning statistics."""
+def _select_in(
+    conn: sqlite3.Connection, sql: str, ids: list[int]
+) -> Iterator[sqlite3.Row]:
+    """Run sql, whose {ids} placeholder becomes an IN list, over ids in chunks."""
+    for start in range(0, len(ids), IN_CHUNK_SIZE):
+        chunk = ids[start:start + IN_CHUNK_SIZE]
+        yield from conn.execute(sql.format(ids=", ".join("?" * len(chunk))), chunk)
+
+
+def review_many(reviews: list[tuple[int, int]]) -> list[dict]:
+    """
+    Record many (card_id, quality) reviews in a single transaction.
+
+    Cards are read with one SELECT, rescheduled in memory (a card reviewed
+    several times is updated in order), then written back with one UPDATE
+    and one INSERT batch. Returns the final scheduling of each reviewed
+    card, in the order first seen.
+    """
+    if not reviews:
+        return []
+    card_ids = list(dict.fromkeys(card_id for card_id, _ in reviews))
+
     conn = connect()
+    with _transaction(conn):
+        state = {
+            row["id"]: (row["repetitions"], row["ease_factor"], row["interval_days"])
+            for row in _select_in(
+                conn,
+                """SELECT id, repetitions, ease_factor, interval_days
+                   FROM cards
+                   WHERE id IN ({ids}) AND deleted_at IS NULL""",
+                card_ids,
+            )
+        }
+        missing = [card_id for card_id in card_ids if card_id not in state]
+        if missing:
+            ids = ", ".join(f"#{card_id}" for card_id in missing)
+            print(f"Card(s) not found: {ids}", file=sys.stderr)
+            sys.exit(1)
+
+        last_quality = {}
+        for card_id, quality in reviews:
+            state[card_id] = sm2_update(quality, *state[card_id])
+            last_quality[card_id] = quality
+
+        conn.executemany(
+            SQL_UPDATE_SCHED,
+            [(reps, ef, interval, interval, card_id)
+             for card_id, (reps, ef, interval) in state.items()],
+        )
+        conn.executemany(
+            SQL_INSERT_REVIEW,
+            [{"card_id": card_id, "quality": quality} for card_id, quality in reviews],
+        )
+        next_reviews = {
+            row["id"]: row["next_review"]
+            for row in _select_in(
+                conn, "SELECT id, next_review FROM cards WHERE id IN ({ids})", card_ids
+            )
+        }
+
+    return [
+        {
+            "card_id": card_id,
+            "quality": last_quality[card_id],
+            "new_interval_days": state[card_id][2],
+            "new_ease_factor": round(state[card_id][1], 2),
+            "next_review": next_reviews[card_id],
+            "repetitions": state[card_id][0],
+        }
+        for card_id in card_ids
+    ]
+
+
+def read_reviews_input(text: str) -> list[tuple[int, int]]:
+    """Parse {"card_id": N, "quality": Q} records from JSON or NDJSON."""
+    reviews = []
+    for i, r in enumerate(_read_json_records(text)):
+        # type() rather than isinstance(): JSON true and 2.0 must not pass as ints
+        if (
+            not isinstance(r, dict)
+            or type(r.get("card_id")) is not int
+            or type(r.get("quality")) is not int
+            or r["quality"] not in range(6)
+        ):
+            raise ValueError(f"review {i}: integer 'card_id' and 'quality' 0-5 are required")
+        reviews.append((r["card_id"], r["quality"]))
+    return reviews
 
-    total = conn.execute(
-        "SELECT COUNT(*) FROM cards WHERE deleted_at IS NULL"
-    ).fetchone()[0]
-    due = conn.execute(
-        "SELECT COUNT(*) FROM cards WHERE deleted_at IS NULL AND next_review <= datetime('now')"
-    ).fetchone()[0]
-    mastered = conn.execute(
-        "SELECT COUNT(*) FROM cards WHERE deleted_at IS NULL AND repetitions >= 5 AND ease_factor >= 2.5"
-    ).fetchone()[0]
-    struggling = conn.execute(
-        "SELECT COUNT(*) FROM cards WHERE deleted_at IS NULL AND ease_factor < 1.8"
-    ).fetchone()[0]
-    sessions_count = conn.execute("SELECT COUNT(*) FROM sessions").fetchone()[0]
-    reviews_count = conn.execute("SELECT COUNT(*) FROM reviews").fetchone()[0]
-
-    avg_ef = conn.execute(
-        "SELECT AVG(ease_factor) FROM cards WHERE deleted_at IS NULL"
-    ).fetchone()[0]
-
-    today_reviews = conn.execute(
-        "SELECT COUNT(*) FROM reviews WHERE date(reviewed_at) = date('now')"
-    ).fetchone()[0]
-
-    upcoming_7d = conn.execute(
-        """SELECT COUNT(*) FROM cards
-           WHERE deleted_at IS NULL
-             AND next_review > datetime('now')
-             AND next_review <= datetime('now', '+7 days')"""
-    ).fetchone()[0]
-
-    # Next scheduled review
-    next_due = conn.execute(
-        """SELECT next_review FROM cards
-           WHERE deleted_at IS NULL AND next_review > datetime('now')
-           ORDER BY next_review ASC LIMIT 1"""
-    ).fetchone()
 
-    conn.close()
+def get_stats() -> dict:
+    """Get learning statistics."""
+    conn = connect_ro()
+    with _lock(conn):
+        now = _now()
+
+        # One pass over the active cards instead of a query per metric,
+        # answered from the covering idx_cards_schedule index
+        cards = conn.execute(
+            """SELECT
+                   COUNT(*) AS total,
+                   COUNT(CASE WHEN next_review <= :now THEN 1 END) AS due,
+                   COUNT(CASE WHEN repetitions >= 5 AND ease_factor >= 2.5 THEN 1 END) AS mastered,
+                   COUNT(CASE WHEN ease_factor < 1.8 THEN 1 END) AS struggling,
+                   AVG(ease_factor) AS avg_ef,
+                   COUNT(CASE WHEN next_review > :now
+                               AND next_review <= :week THEN 1 END) AS upcoming_7d,
+                   MIN(CASE WHEN next_review > :now THEN next_review END) AS next_due
+               FROM cards
+               WHERE deleted_at IS NULL""",
+            {"now": now, "week": _now(days=7)},
+        ).fetchone()
+        activity = conn.execute(
+            """SELECT
+                   (SELECT COUNT(*) FROM sessions) AS sessions_count,
+                   (SELECT COUNT(*) FROM reviews) AS reviews_count,
+                   (SELECT COUNT(*) FROM reviews
+                    WHERE reviewed_at >= ?) AS today_reviews""",
+            (now[:10],),
+        ).fetchone()
+
+        avg_ef = cards["avg_ef"]
 
     return {
-        "total_cards": total,
-        "due_now": due,
-        "mastered": mastered,
-        "struggling": struggling,
-        "sessions": sessions_count,
-        "total_reviews": reviews_count,
-        "today_reviews": today_reviews,
-        "upcoming_7d": upcoming_7d,
+        "total_cards": cards["total"],
+        "due_now": cards["due"],
+        "mastered": cards["mastered"],
+        "struggling": cards["struggling"],
+        "sessions": activity["sessions_count"],
+        "total_reviews": activity["reviews_count"],
+        "today_reviews": activity["today_reviews"],
+        "upcoming_7d": cards["upcoming_7d"],
         "avg_ease_factor": round(avg_ef, 2) if avg_ef else None,
-        "next_scheduled": next_due[0] if next_due else None,
+        "next_scheduled": cards["next_due"],
     }
 
 
 def list_cards(
     topic: str | None = None, session_id: int | None = None
-) -> list[dict]:
+) -> list[sqlite3.Row]:
     """List active cards, filtered by topic text or session ID."""
-    conn = connect()
-    if session_id is not None:
-        rows = conn.execute(
-            """SELECT id, question, answer, context, tags, difficulty,
-                      ease_factor, interval_days, repetitions, next_review
-               FROM cards
-               WHERE deleted_at IS NULL AND session_id = ?
-               ORDER BY created_at DESC""",
-            (session_id,),
-        ).fetchall()
-    elif topic:
-        rows = conn.execute(
-            """SELECT id, question, answer, context, tags, difficulty,
-                      ease_factor, interval_days, repetitions, next_review
-               FROM cards
-               WHERE deleted_at IS NULL
-                 AND (tags LIKE ? OR context LIKE ? OR question LIKE ?)
-               ORDER BY created_at DESC""",
-            (f"%{topic}%", f"%{topic}%", f"%{topic}%"),
-        ).fetchall()
-    else:
-        rows = conn.execute(
-            """SELECT id, question, answer, context, tags, difficulty,
-                      ease_factor, interval_days, repetitions, next_review
-               FROM cards WHERE deleted_at IS NULL
-               ORDER BY created_at DESC"""
-        ).fetchall()
-    conn.close()
-    return [dict(r) for r in rows]
+    conn = connect_ro()
+    with _lock(conn):
+        if session_id is not None:
+            rows = conn.execute(
+                """SELECT id, question, answer, context, tags, difficulty,
+                          ease_factor, interval_days, repetitions, next_review
+                   FROM cards
+                   WHERE deleted_at IS NULL AND session_id = ?
+                   ORDER BY created_at DESC""",
+                (session_id,),
+            ).fetchall()
+        elif topic:
+            # Quoted phrase with prefix match: user text never hits FTS5 syntax
+            match = '"' + topic.replace('"', '""') + '"*'
+            try:
+                rows = conn.execute(
+                    """SELECT c.id, c.question, c.answer, c.context, c.tags, c.difficulty,
+                              c.ease_factor, c.interval_days, c.repetitions, c.next_review
+                       FROM cards c
+                       JOIN cards_fts f ON f.rowid = c.id
+                       WHERE cards_fts MATCH ? AND c.deleted_at IS NULL
+                       ORDER BY c.created_at DESC""",
+                    (match,),
+                ).fetchall()
+            except sqlite3.OperationalError:
+                # No cards_fts table (database predates it or FTS5 missing).
+                # instr() skips LIKE's pattern/escape handling. SQLite's lower()
+                # is applied to both sides so folding matches exactly (ASCII
+                # only, like the LIKE scan it replaces).
+                rows = conn.execute(
+                    """SELECT id, question, answer, context, tags, difficulty,
+                              ease_factor, interval_days, repetitions, next_review
+                       FROM cards
+                       WHERE deleted_at IS NULL
+                         AND (instr(lower(tags), lower(?)) > 0
+                              OR instr(lower(context), lower(?)) > 0
+                              OR instr(lower(question), lower(?)) > 0)
+                       ORDER BY created_at DESC""",
+                    (topic, topic, topic),
+                ).fetchall()
+        else:
+            rows = conn.execute(SQL_LIST_CARDS).fetchall()
+    return rows
 
 
-def list_sessions() -> list[dict]:
+def list_sessions() -> list[sqlite3.Row]:
     """List all teach-back sessions."""
-    conn = connect()
-    rows = conn.execute(
-        "SELECT * FROM sessions ORDER BY created_at DESC"
-    ).fetchall()
-    conn.close()
-    return [dict(r) for r in rows]
+    conn = connect_ro()
+    with _lock(conn):
+        rows = conn.execute(
+            "SELECT * FROM sessions ORDER BY created_at DESC"
+        ).fetchall()
+    return rows
 
 
-def export_cards(fmt: str = "md") -> str:
-    """Export all active cards in markdown or CSV format."""
-    cards = list_cards()
+def _format_export(cards: Iterable[sqlite3.Row], fmt: str) -> Iterator[str]:
+    """Render exported card rows as markdown or CSV lines."""
     if fmt == "csv":
-        lines = ["question,answer,context,tags,difficulty,ease_factor,interval_days,repetitions"]
+        buf = io.StringIO()
+        writer = csv.writer(buf, lineterminator="\n")
+        writer.writerow([
+            "question", "answer", "context", "tags", "difficulty",
+            "ease_factor", "interval_days", "repetitions",
+        ])
         for c in cards:
-            q = c["question"].replace('"', '""')
-            a = c["answer"].replace('"', '""')
-            ctx = (c["context"] or "").replace('"', '""')
-            tags = (c["tags"] or "").replace('"', '""')
-            lines.append(
-                f'"{q}","{a}","{ctx}","{tags}",'
-                f'"{c["difficulty"]}",{c["ease_factor"]},{c["interval_days"]},{c["repetitions"]}'
-            )
-        return "\n".join(lines)
+            writer.writerow([
+                c["question"], c["answer"], c["context"] or "", c["tags"] or "",
+                c["difficulty"], c["ease_factor"], c["interval_days"], c["repetitions"],
+            ])
+            yield buf.getvalue()
+            buf.seek(0)
+            buf.truncate()
+        # Flush what is left: the header alone when there are no cards
+        yield buf.getvalue()
     else:
-        lines = ["# SRS Cards Export\n"]
+        yield "# SRS Cards Export\n\n"
         for c in cards:
-            lines.append(f"## Card #{c['id']}")
-            lines.append(f"**Q:** {c['question']}")
-            lines.append(f"**A:** {c['answer']}")
+            yield f"## Card #{c['id']}\n"
+            yield f"**Q:** {c['question']}\n"
+            yield f"**A:** {c['answer']}\n"
             if c["context"]:
-                lines.append(f"**Context:** `{c['context']}`")
+                yield f"**Context:** `{c['context']}`\n"
             if c["tags"]:
-                lines.append(f"**Tags:** {c['tags']}")
-            lines.append(
+                yield f"**Tags:** {c['tags']}\n"
+            yield (
                 f"**Status:** EF={c['ease_factor']:.2f} | "
-                f"interval={c['interval_days']}d | reps={c['repetitions']}"
+                f"interval={c['interval_days']}d | reps={c['repetitions']}\n"
             )
-            lines.append("")
-        return "\n".join(lines)
+            yield "\n"
 
 
-def main():
+def iter_export_cards(fmt: str = "md") -> Iterator[str]:
+    """
+    Yield an export of all active cards, line by line, in markdown or CSV format.
+
+    The export reads through its own read-only connection: a cursor left open
+    across yields pins that connection's read snapshot, which would hide new
+    writes from readers on the shared connect_ro() connection.
+    """
+    conn = _new_connection(get_db_path(), readonly=True)
+    try:
+        # Iterate the cursor directly so rows are never materialized as a list
+        yield from _format_export(conn.execute(SQL_LIST_CARDS), fmt)
+    finally:
+        conn.close()
+
+
+def export_cards(fmt: str = "md") -> str:
+    """Export all active cards in markdown or CSV format."""
+    return "".join(iter_export_cards(fmt))
+
+
+# Commands that consume stdin themselves and so cannot run inside batch
+STDIN_COMMANDS = {"add-cards", "review-many", "batch"}
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the CLI argument parser."""
     parser = argparse.ArgumentParser(description="SRS Database Manager")
     sub = parser.add_subparsers(dest="command")
 
@@ -389,15 +856,22 @@ def main():
     p_card.add_argument("--answer", required=True)
     p_card.add_argument("--context", default="")
     p_card.add_argument("--tags", default="")
-    p_card.add_argument("--difficulty", default="medium", choices=["easy", "medium", "hard"])
+    p_card.add_argument("--difficulty", default="medium", choices=DIFFICULTIES)
     p_card.add_argument("--session-id", type=int, default=None, dest="session_id")
 
-    sub.add_parser("due", help="List due cards")
+    sub.add_parser("add-cards", help="Add flashcards from JSON/NDJSON on stdin")
+
+    p_due = sub.add_parser("due", help="List due cards")
+    p_due.add_argument("--limit", type=int, default=20)
+    p_due.add_argument("--after-review", default=None, dest="after_review")
+    p_due.add_argument("--after-id", type=int, default=None, dest="after_id")
 
     p_review = sub.add_parser("review", help="Record a review")
     p_review.add_argument("--card-id", type=int, required=True, dest="card_id")
     p_review.add_argument("--quality", type=int, required=True, choices=range(6))
 
+    sub.add_parser("review-many", help="Record reviews from JSON/NDJSON on stdin")
+
     sub.add_parser("stats", help="Show statistics")
 
     p_cards = sub.add_parser("cards", help="List cards")
@@ -409,8 +883,42 @@ def main():
     p_export = sub.add_parser("export", help="Export cards")
     p_export.add_argument("--format", default="md", choices=["md", "csv"], dest="fmt")
 
-    args = parser.parse_args()
+    sub.add_parser("batch", help="Run newline-delimited commands from stdin")
+
+    sub.add_parser("vacuum", help="Compact database and refresh query planner statistics")
 
+    return parser
+
+
+def run_batch(parser: argparse.ArgumentParser, lines: Iterable[str]) -> int:
+    """
+    Run one CLI command per line in this process. Returns the failure count.
+
+    Blank lines and lines starting with # are skipped. A failing line is
+    reported on stderr and the remaining lines still run.
+    """
+    failures = 0
+    for lineno, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        try:
+            argv = shlex.split(line)
+            if argv[0] in STDIN_COMMANDS:
+                raise ValueError(f"'{argv[0]}' reads stdin and cannot run in batch")
+            _dispatch(parser, parser.parse_args(argv))
+        except (ValueError, sqlite3.Error) as e:
+            print(f"Line {lineno}: {e}", file=sys.stderr)
+            failures += 1
+        except SystemExit as e:
+            if e.code:
+                print(f"Line {lineno}: command failed", file=sys.stderr)
+                failures += 1
+    return failures
+
+
+def _dispatch(parser: argparse.ArgumentParser, args: argparse.Namespace) -> None:
+    """Run the command selected by parsed CLI arguments."""
     if args.command == "init":
         init_db()
     elif args.command == "add-session":
@@ -420,8 +928,18 @@ def main():
             args.question, args.answer, args.context,
             args.tags, args.difficulty, args.session_id,
         )
+    elif args.command == "add-cards":
+        try:
+            card_ids = add_cards_bulk(read_cards_input(sys.stdin.read()))
+        except (ValueError, sqlite3.IntegrityError) as e:
+            # IntegrityError: e.g. a session_id with no matching session
+            print(f"Invalid card input: {e}", file=sys.stderr)
+            sys.exit(1)
+        print(f"{len(card_ids)} card(s) added.")
     elif args.command == "due":
-        cards = get_due_cards()
+        if (args.after_review is None) != (args.after_id is None):
+            parser.error("due: --after-review and --after-id must be given together")
+        cards = get_due_cards(args.limit, args.after_review, args.after_id)
         if not cards:
             print("No cards due for review.")
         else:
@@ -429,9 +947,21 @@ def main():
             for c in cards:
                 print(f"  #{c['id']} [{c['difficulty']}] {c['question'][:80]}")
                 print(f"    EF={c['ease_factor']:.2f} | interval={c['interval_days']}d | reps={c['repetitions']}")
+            if len(cards) == args.limit:
+                last = cards[-1]
+                print(f"\nNext page: due --limit {args.limit} "
+                      f"--after-review '{last['next_review']}' --after-id {last['id']}")
     elif args.command == "review":
         result = record_review(args.card_id, args.quality)
         print(json.dumps(result, indent=2))
+    elif args.command == "review-many":
+        try:
+            reviews = read_reviews_input(sys.stdin.read())
+        except ValueError as e:
+            print(f"Invalid review input: {e}", file=sys.stderr)
+            sys.exit(1)
+        results = review_many(reviews)
+        print(json.dumps(results, indent=2))
     elif args.command == "stats":
         stats = get_stats()
         print(json.dumps(stats, indent=2))
@@ -450,10 +980,20 @@ def main():
             for s in sessions:
                 print(f"  #{s['id']} {s['topic']} ({s['gaps_found']} gaps, {s['cards_generated']} cards)")
     elif args.command == "export":
-        print(export_cards(args.fmt))
+        sys.stdout.writelines(iter_export_cards(args.fmt))
+    elif args.command == "vacuum":
+        vacuum_db()
+    elif args.command == "batch":
+        if run_batch(parser, sys.stdin):
+            sys.exit(1)
     else:
         parser.print_help()
 
 
+def main():
+    parser = build_parser()
+    _dispatch(parser, parser.parse_args())
+
+
 if __name__ == "__main__":
     main()